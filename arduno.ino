@@ -4,9 +4,11 @@
  * This sketch allows an Arduino to communicate with the Python Digital Twin application.
  * It controls a physical servo motor and reports back the actual position.
  * 
- * Communication Protocol:
- * - Receive: "S:angle\n" - Set servo to the specified angle (0-180)
- * - Send: "A:angle\n" - Report the current servo angle
+ * Communication Protocol (two-byte binary frames: header, angle):
+ * - Receive: 0xFF angle - Set servo to the specified angle (0-180)
+ * - Send: 0xFF angle - Report the current servo angle
+ * - Send: 0xFE angle - Acknowledge a set command
+ * Header bytes are above 180 so they can never be mistaken for an angle.
  * 
  * Circuit:
  * - Servo signal pin connected to Arduino pin 9
@@ -21,14 +23,16 @@
 #define POT_PIN A0          // Optional: Analog pin for potentiometer
 
 // Communication settings
-#define BAUD_RATE 9600      // Must match the Python application
+#define BAUD_RATE 115200    // Must match the Python application (--baud)
 #define COMMAND_TIMEOUT 20  // Milliseconds to wait for complete command
 #define STATUS_INTERVAL 500 // Milliseconds between status updates
 
-// Buffer for receiving commands
-#define BUFFER_SIZE 20
-char buffer[BUFFER_SIZE];
-int bufferIndex = 0;
+// Frame headers
+#define ANGLE_HEADER 0xFF   // Set angle command / angle report
+#define ACK_HEADER 0xFE     // Command acknowledgment
+
+// Receive state: true once a header has arrived and its angle byte is pending
+bool awaitingAngle = false;
 
 // Servo variables
 Servo myServo;
@@ -59,11 +63,8 @@ void setup() {
   myServo.write(currentAngle);
   delay(500); // Give time for servo to reach position
   
-  // Send initial status
+  // Send initial status (also announces that the sketch is ready)
   reportStatus();
-  
-  // Announce ready
-  Serial.println("Ready");
 }
 
 void loop() {
@@ -90,48 +91,42 @@ void loop() {
 // Process incoming serial data
 void readSerialCommands() {
   while (Serial.available() > 0) {
-    char inChar = (char)Serial.read();
+    int inByte = Serial.read();
     
-    // Reset buffer on timeout
+    // Drop a half-received frame on timeout
     unsigned long currentTime = millis();
-    if (bufferIndex > 0 && currentTime - lastCommandTime > COMMAND_TIMEOUT) {
-      bufferIndex = 0;
+    if (awaitingAngle && currentTime - lastCommandTime > COMMAND_TIMEOUT) {
+      awaitingAngle = false;
     }
     lastCommandTime = currentTime;
     
-    // Process character
-    if (inChar == '\n') {
+    // Process byte
+    if (inByte == ANGLE_HEADER) {
+      // Start of a new frame, the angle follows
+      awaitingAngle = true;
+    } else if (awaitingAngle) {
       // Complete command received, process it
-      buffer[bufferIndex] = '\0'; // Null-terminate
-      processCommand(buffer);
-      bufferIndex = 0; // Reset buffer
-    } else if (bufferIndex < BUFFER_SIZE - 1) {
-      // Add character to buffer
-      buffer[bufferIndex++] = inChar;
+      awaitingAngle = false;
+      processCommand(inByte);
     }
   }
 }
 
-// Process complete command
-void processCommand(char* cmd) {
-  // Check if command is to set servo angle (format: "S:angle")
-  if (cmd[0] == 'S' && cmd[1] == ':') {
-    int angle = atoi(&cmd[2]);
+// Process complete set-angle command
+void processCommand(int angle) {
+  // Validate angle
+  if (angle >= 0 && angle <= 180) {
+    // Set target angle
+    targetAngle = angle;
     
-    // Validate angle
-    if (angle >= 0 && angle <= 180) {
-      // Set target angle
-      targetAngle = angle;
-      
-      // Make sure servo is attached
-      if (!servoAttached) {
-        attachServo();
-      }
-      
-      // Acknowledge command
-      Serial.print("ACK:");
-      Serial.println(angle);
+    // Make sure servo is attached
+    if (!servoAttached) {
+      attachServo();
     }
+    
+    // Acknowledge command
+    Serial.write(ACK_HEADER);
+    Serial.write((uint8_t)angle);
   }
 }
 
@@ -157,8 +152,8 @@ void updateServoPosition(unsigned long currentTime) {
 
 // Report current status to serial
 void reportStatus() {
-  Serial.print("A:");
-  Serial.println(currentAngle);
+  Serial.write(ANGLE_HEADER);
+  Serial.write((uint8_t)currentAngle);
 }
 
 // Optional: Read potentiometer value to control servo
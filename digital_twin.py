@@ -1,14 +1,35 @@
 #!/usr/bin/env python3
 import serial
 import time
+import struct
 import pygame
 from pygame.locals import *
 from OpenGL.GL import *
 from OpenGL.GLU import *
 import threading
 import math
+import ctypes
 import sys
 import os
+import select
+import numpy as np
+
+# Size of the persistent texture that rendered text is uploaded into
+TEXT_TEXTURE_SIZE = (512, 64)
+
+# Minimum time between angle commands sent to the Arduino (seconds)
+SEND_INTERVAL = 0.02
+
+# Speed of the on-screen servo animation
+SPEED_DEG_PER_SEC = 90.0
+
+# Event types handle_events reacts to; everything else is kept off the queue
+HANDLED_EVENTS = [pygame.QUIT, pygame.MOUSEWHEEL, pygame.KEYDOWN, pygame.VIDEOEXPOSE]
+
+# Serial frame headers; frames are two bytes, header then angle (0-180)
+ANGLE_HEADER = 0xFF  # Set angle (to Arduino) / angle report (from Arduino)
+ACK_HEADER = 0xFE    # Command acknowledgment from Arduino
+FRAME = struct.Struct('BB')  # (header, angle)
 
 # Initialize GLUT if available, but provide fallback
 try:
@@ -20,7 +41,7 @@ except Exception:
 
 # Servo Digital Twin Class
 class ServoDigitalTwin:
-    def __init__(self, port=None, baud_rate=9600):
+    def __init__(self, port=None, baud_rate=115200):
         self.angle = 90  # Initial angle
         self.target_angle = 90  # Target angle for smooth transitions
         self.port = port
@@ -30,17 +51,35 @@ class ServoDigitalTwin:
         self.lock = threading.Lock()
         self.arduino = None
         self.step_size = 10  # Changed from 5 to 10 degrees
+        self._serial_buffer = bytearray()  # Partial frame received from Arduino
+        self._pending_angle = None  # Latest angle waiting to be sent
+        self._last_sent = None
+        self._last_send_time = 0.0
+        self.dirty = True  # Redraw needed on the next frame
+        self.status_text = "Arduino: Disconnected"
+        self._last_update = time.perf_counter()  # Time of the last animation step
         
-        # Setup PyGame and OpenGL
-        pygame.init()
+        # Setup PyGame and OpenGL (only the display; audio and joystick are unused)
+        pygame.display.init()
         display = (800, 600)
-        pygame.display.set_mode(display, DOUBLEBUF | OPENGL)
+        try:
+            pygame.display.set_mode(display, DOUBLEBUF | OPENGL, vsync=1)
+            self.max_fps = 240  # Safety cap in case the driver ignores the swap interval
+        except pygame.error:
+            # Vsync not available (e.g. VMs, remote sessions); cap the frame rate ourselves
+            print("Warning: vsync not available, limiting to 60 FPS")
+            pygame.display.set_mode(display, DOUBLEBUF | OPENGL)
+            self.max_fps = 60
         pygame.display.set_caption('Servo Motor Digital Twin')
+        pygame.event.set_blocked(None)
+        pygame.event.set_allowed(HANDLED_EVENTS)
         
         # Initialize default font for text rendering
         pygame.font.init()
         if not pygame.font.get_init():
             print("Warning: Font initialization failed")
+        self._font = pygame.font.SysFont('Arial', 24)
+        self._text_cache = {}  # text -> (width, height, RGBA data)
         
         # OpenGL initialization
         glMatrixMode(GL_PROJECTION)
@@ -55,6 +94,28 @@ class ServoDigitalTwin:
         glLightfv(GL_LIGHT0, GL_POSITION, [1, 1, 1, 0])
         glLightfv(GL_LIGHT0, GL_AMBIENT, [0.2, 0.2, 0.2, 1])
         glLightfv(GL_LIGHT0, GL_DIFFUSE, [0.8, 0.8, 0.8, 1])
+        glEnable(GL_NORMALIZE)  # Parts are drawn scaled, keep normals unit length
+        
+        # Allocate one texture per text slot; strings are uploaded into it with glTexSubImage2D
+        self._text_textures = {}  # slot -> texture id
+        self._last_text = {}  # slot -> text currently held by its texture
+        self._text_extent = {}  # slot -> (width, height) of the text currently uploaded
+        # Transparent texels so unwritten areas never show through the linear filter
+        self._text_blank = bytes(TEXT_TEXTURE_SIZE[0] * TEXT_TEXTURE_SIZE[1] * 4)
+        for slot in ('angle', 'status'):
+            texture_id = glGenTextures(1)
+            glBindTexture(GL_TEXTURE_2D, texture_id)
+            glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_MAG_FILTER, GL_LINEAR)
+            glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_MIN_FILTER, GL_LINEAR)
+            glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_WRAP_S, GL_CLAMP_TO_EDGE)
+            glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_WRAP_T, GL_CLAMP_TO_EDGE)
+            glTexImage2D(GL_TEXTURE_2D, 0, GL_RGBA, TEXT_TEXTURE_SIZE[0], TEXT_TEXTURE_SIZE[1],
+                         0, GL_RGBA, GL_UNSIGNED_BYTE, self._text_blank)
+            self._text_textures[slot] = texture_id
+        glBindTexture(GL_TEXTURE_2D, 0)
+        
+        # Compile the static servo geometry once so each frame only replays it
+        self.compile_servo_lists()
         
         # Connect to Arduino if port is specified
         if self.port:
@@ -82,13 +143,19 @@ class ServoDigitalTwin:
             self.arduino = serial.Serial(
                 port=self.port,
                 baudrate=self.baud_rate,
-                timeout=1,
+                timeout=0.01,
                 write_timeout=1,
                 bytesize=serial.EIGHTBITS,
                 parity=serial.PARITY_NONE,
                 stopbits=serial.STOPBITS_ONE
             )
             
+            # Ask the USB-serial driver to deliver bytes immediately (not supported everywhere)
+            try:
+                self.arduino.set_low_latency_mode(True)
+            except (AttributeError, OSError, ValueError):
+                pass
+            
             # Wait for connection to establish
             time.sleep(2)
             
@@ -99,13 +166,19 @@ class ServoDigitalTwin:
                 
                 # Try to send a test message and read response
                 try:
-                    self.arduino.write(b"S:90\n")
+                    self.arduino.write(FRAME.pack(ANGLE_HEADER, 90))
                     time.sleep(0.5)
                     if self.arduino.in_waiting > 0:
-                        response = self.arduino.readline()
-                        print(f"Arduino response: {response.decode('utf-8', errors='replace').strip()}")
+                        response = self.arduino.read(self.arduino.in_waiting)
+                        print(f"Arduino response: {response.hex(' ')}")
                 except Exception as e:
                     print(f"Warning: Test message failed but continuing: {e}")
+                
+                # Opening the port resets the Arduino to 90 and the test message sent 90,
+                # so forget what was sent on any previous connection
+                with self.lock:
+                    self._last_sent = 90
+                    self._pending_angle = None
             else:
                 raise Exception("Port could not be opened")
                 
@@ -114,6 +187,16 @@ class ServoDigitalTwin:
             print("Running in simulation mode")
             self.arduino = None
             self.serial_connected = False
+        
+        self.update_status()
+    
+    def update_status(self):
+        """Refresh the connection status text after the connection changed"""
+        status = "Connected" if (self.arduino and self.arduino.is_open) else "Disconnected"
+        status_text = f"Arduino: {status}"
+        if status_text != self.status_text:
+            self.status_text = status_text
+            self.dirty = True
     
     def read_from_arduino(self):
         """Thread function to read data from Arduino"""
@@ -122,38 +205,70 @@ class ServoDigitalTwin:
         
         while self.running:
             try:
-                if self.arduino and self.arduino.is_open and self.arduino.in_waiting > 0:
-                    line = self.arduino.readline().decode('utf-8', errors='replace').strip()
-                    if line.startswith("A:"):
-                        # Update angle from physical servo
-                        with self.lock:
-                            try:
-                                new_angle = int(line[2:])
-                                if 0 <= new_angle <= 180:
-                                    self.angle = new_angle
-                                    self.target_angle = new_angle
-                                    print(f"Servo angle: {self.angle}°")
-                            except ValueError:
-                                pass
-                time.sleep(0.05)  # Small delay to prevent CPU hogging
+                if not (self.arduino and self.arduino.is_open):
+                    time.sleep(1)  # Wait for a reconnection
+                    continue
+                
+                if hasattr(self.arduino, 'fd'):
+                    # POSIX: wait on the descriptor and take whatever the kernel has buffered
+                    ready, _, _ = select.select([self.arduino.fd], [], [], 0.1)
+                    if not ready:
+                        continue
+                    try:
+                        data = os.read(self.arduino.fd, 4096)
+                    except (BlockingIOError, InterruptedError):
+                        continue  # Port is non-blocking; spurious wakeup, nothing to read yet
+                    if not data:
+                        raise serial.SerialException("Device disconnected")
+                else:
+                    # Block until a byte arrives, then drain everything available
+                    data = self.arduino.read(1)
+                    if not data:
+                        continue
+                    data += self.arduino.read(self.arduino.in_waiting)
+                self.handle_serial_data(data)
             except Exception as e:
                 print(f"Serial reading error: {e}")
                 # Don't break the loop - try to recover
                 try:
                     if self.arduino and self.arduino.is_open:
                         self.arduino.close()
+                    self.update_status()
                     time.sleep(1)  # Wait before attempting reconnection
                     self.connect_to_arduino()  # Try to reconnect
                 except Exception:
                     time.sleep(2)  # Wait longer before next attempt
     
+    def handle_serial_data(self, data):
+        """Process every complete frame received from Arduino"""
+        buffer = self._serial_buffer
+        buffer += data
+        i = 0
+        while i + 1 < len(buffer):
+            # Skip bytes until we are aligned on a header; a header followed by another
+            # header lost its angle byte, so resync on the second one
+            if buffer[i] not in (ANGLE_HEADER, ACK_HEADER) or buffer[i + 1] > 180:
+                i += 1
+                continue
+            header, new_angle = FRAME.unpack_from(buffer, i)
+            i += FRAME.size
+            if header == ANGLE_HEADER:
+                # Update angle from physical servo
+                with self.lock:
+                    self.angle = new_angle
+                    self.target_angle = new_angle
+                    # The servo is now here (e.g. moved by the potentiometer), so stepping
+                    # back to the previously sent angle must not count as a duplicate
+                    self._last_sent = new_angle
+                    self.dirty = True
+                    print(f"Servo angle: {self.angle}°")
+        del buffer[:i]
+    
     def send_to_arduino(self, angle):
         """Send angle command to Arduino"""
         if self.serial_connected and self.arduino and self.arduino.is_open:
             try:
-                # Format: S:angle\n
-                command = f"S:{angle}\n"
-                self.arduino.write(command.encode())
+                self.arduino.write(FRAME.pack(ANGLE_HEADER, int(angle)))
                 print(f"Sent to Arduino: {angle}°")
             except Exception as e:
                 print(f"Error sending to Arduino: {e}")
@@ -165,57 +280,96 @@ class ServoDigitalTwin:
                     pass
     
     def update_angle(self, new_angle):
-        """Update the servo angle and send to Arduino"""
+        """Update the servo angle and queue it for the Arduino"""
         with self.lock:
             if 0 <= new_angle <= 180:
                 self.target_angle = new_angle
-                if self.serial_connected:
-                    self.send_to_arduino(new_angle)
+                self._pending_angle = new_angle
+                self.dirty = True
+    
+    def flush_serial(self):
+        """Send the latest queued angle, at most once per SEND_INTERVAL"""
+        if not self.serial_connected:
+            return
+        now = time.perf_counter()
+        with self.lock:
+            angle = self._pending_angle
+            if angle in (None, self._last_sent) or now - self._last_send_time <= SEND_INTERVAL:
+                return
+            self._pending_angle = None
+            self._last_sent = angle
+            self._last_send_time = now
+        self.send_to_arduino(angle)
+    
+    def compile_servo_lists(self):
+        """Compile the servo geometry into display lists"""
+        # The vertex buffers are only used here, at startup: the display lists copy the
+        # vertex data at compile time, so the buffers are deleted once both lists are built
+        # and every frame just replays the lists
+        cube_vbo = self.upload_vertices(self.cube_vertices())  # draw_cube scales it to size
+        base_vbo = self.upload_vertices(self.cylinder_vertices(0.5, 0.5, 0.3, 20))
+        shaft_vbo = self.upload_vertices(self.cylinder_vertices(0.1, 0.1, 0.2, 10))
+        
+        # Horn is a cross of a main arm and a cross arm, merged into one VBO
+        horn_vbo = self.upload_vertices(np.concatenate([
+            self.cube_vertices(0.8, 0.2, 0.1),
+            self.cube_vertices(0.2, 0.8, 0.1),
+        ]))
+        
+        # Base and body never move; shaft and horn are replayed under the current rotation
+        self.body_list = glGenLists(2)
+        self.shaft_list = self.body_list + 1
+        
+        glNewList(self.body_list, GL_COMPILE)
+        # Draw base (cylinder)
+        glPushMatrix()
+        glColor3f(0.2, 0.2, 0.2)  # Dark gray
+        self.draw_cylinder(base_vbo, 20)
+        glPopMatrix()
+        
+        # Draw servo body (box)
+        glPushMatrix()
+        glTranslatef(0, 0, 0.3)
+        glColor3f(0.0, 0.3, 0.7)  # Blue
+        self.draw_cube(cube_vbo, 1.0, 1.0, 0.5)
+        glPopMatrix()
+        glEndList()
+        
+        glNewList(self.shaft_list, GL_COMPILE)
+        # Draw shaft
+        glColor3f(0.7, 0.7, 0.7)  # Light gray
+        self.draw_cylinder(shaft_vbo, 10)
+        
+        # Draw horn
+        glPushMatrix()
+        glTranslatef(0, 0, 0.2)
+        glColor3f(1.0, 0.5, 0.0)  # Orange
+        self.draw_horn(horn_vbo)
+        glPopMatrix()
+        glEndList()
+        
+        glDeleteBuffers(4, [cube_vbo, base_vbo, shaft_vbo, horn_vbo])
     
     def draw_servo(self):
         """Draw the 3D servo model"""
         glClear(GL_COLOR_BUFFER_BIT | GL_DEPTH_BUFFER_BIT)
         
         try:
-            # Draw base (cylinder)
-            glPushMatrix()
-            glColor3f(0.2, 0.2, 0.2)  # Dark gray
-            self.draw_cylinder(0.5, 0.5, 0.3, 20)
-            glPopMatrix()
+            # Draw base and body
+            glCallList(self.body_list)
             
-            # Draw servo body (box)
-            glPushMatrix()
-            glTranslatef(0, 0, 0.3)
-            glColor3f(0.0, 0.3, 0.7)  # Blue
-            self.draw_cube(1.0, 1.0, 0.5)
-            glPopMatrix()
-            
-            # Draw rotating shaft with current angle
+            # Draw rotating shaft and horn with current angle
             glPushMatrix()
             glTranslatef(0, 0, 0.8)
             glRotatef(self.angle, 0, 0, 1)  # Apply rotation around z-axis
-            
-            # Draw shaft
-            glColor3f(0.7, 0.7, 0.7)  # Light gray
-            self.draw_cylinder(0.1, 0.1, 0.2, 10)
-            
-            # Draw horn
-            glPushMatrix()
-            glTranslatef(0, 0, 0.2)
-            glColor3f(1.0, 0.5, 0.0)  # Orange
-            self.draw_horn()
-            glPopMatrix()
-            
+            glCallList(self.shaft_list)
             glPopMatrix()
             
             # Draw angle text (position moved to make it more visible)
-            self.render_text(f"Angle: {int(self.angle)}°", -1.5, -1.5, -3)
+            self.render_text(f"Angle: {int(self.angle)}°", -1.5, -1.5, -3, 'angle')
             
-            # Add connection status
-            status = "Connected" if (self.arduino and self.arduino.is_open) else "Disconnected"
-            color = "green" if (self.arduino and self.arduino.is_open) else "red"
-            status_text = f"Arduino: {status}"
-            self.render_text(status_text, -1.5, -1.7, -3)
+            # Add connection status (texture is only re-uploaded when it changes)
+            self.render_text(self.status_text, -1.5, -1.7, -3, 'status')
             
             pygame.display.flip()
             
@@ -227,155 +381,157 @@ class ServoDigitalTwin:
             except:
                 pass
     
-    def render_text(self, text, x, y, z):
+    def render_text(self, text, x, y, z, slot):
         """Simple method to render text in OpenGL (using Pygame instead of GLUT for compatibility)"""
         # Skip text rendering if no text to display
         if not text:
             return
             
+        # Render the text surface once per distinct string
+        cached = self._text_cache.get(text)
+        if cached is None:
+            text_surface = self._font.render(text, True, (255, 255, 255))
+            cached = (text_surface.get_width(), text_surface.get_height(),
+                      pygame.image.tobytes(text_surface, "RGBA"))
+            self._text_cache[text] = cached
+        text_width, text_height, text_data = cached
+        text_width = min(text_width, TEXT_TEXTURE_SIZE[0])
+        text_height = min(text_height, TEXT_TEXTURE_SIZE[1])
+        
         # Disable lighting for text rendering
         glDisable(GL_LIGHTING)
-        
-        # Create a Pygame surface with the text
-        font = pygame.font.SysFont('Arial', 24)
-        text_surface = font.render(text, True, (255, 255, 255))
-        text_data = pygame.image.tostring(text_surface, "RGBA", True)
-        
-        # Enable texture for text rendering
         glEnable(GL_TEXTURE_2D)
-        texture_id = glGenTextures(1)
-        glBindTexture(GL_TEXTURE_2D, texture_id)
+        glBindTexture(GL_TEXTURE_2D, self._text_textures[slot])
         
-        # Set texture parameters
-        glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_MAG_FILTER, GL_LINEAR)
-        glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_MIN_FILTER, GL_LINEAR)
-        glTexImage2D(GL_TEXTURE_2D, 0, GL_RGBA, text_surface.get_width(), text_surface.get_height(), 
-                    0, GL_RGBA, GL_UNSIGNED_BYTE, text_data)
+        # Only upload when the slot's texture holds a different string
+        if text != self._last_text.get(slot):
+            # Clear what is left of a larger previous string before the new one goes in
+            old_width, old_height = self._text_extent.get(slot, (0, 0))
+            if old_width > text_width or old_height > text_height:
+                glTexSubImage2D(GL_TEXTURE_2D, 0, 0, 0, old_width, old_height,
+                                GL_RGBA, GL_UNSIGNED_BYTE, self._text_blank)
+            self._text_extent[slot] = (text_width, text_height)
+            
+            # tobytes packs rows tightly, so the row length is the full surface width
+            glPixelStorei(GL_UNPACK_ROW_LENGTH, cached[0])
+            glTexSubImage2D(GL_TEXTURE_2D, 0, 0, 0, text_width, text_height,
+                            GL_RGBA, GL_UNSIGNED_BYTE, text_data)
+            glPixelStorei(GL_UNPACK_ROW_LENGTH, 0)
+            self._last_text[slot] = text
         
         # Position and draw the text as a textured quad
         glColor3f(1.0, 1.0, 1.0)  # White
-        width, height = text_surface.get_width() / 250, text_surface.get_height() / 250
+        width, height = text_width / 250, text_height / 250
+        u = text_width / TEXT_TEXTURE_SIZE[0]
+        v = text_height / TEXT_TEXTURE_SIZE[1]
         
+        # Surface rows are uploaded top-down, so texture v runs opposite to y
         glBegin(GL_QUADS)
-        glTexCoord2f(0, 0); glVertex3f(x, y, z)
-        glTexCoord2f(1, 0); glVertex3f(x + width, y, z)
-        glTexCoord2f(1, 1); glVertex3f(x + width, y + height, z)
-        glTexCoord2f(0, 1); glVertex3f(x, y + height, z)
+        glTexCoord2f(0, v); glVertex3f(x, y, z)
+        glTexCoord2f(u, v); glVertex3f(x + width, y, z)
+        glTexCoord2f(u, 0); glVertex3f(x + width, y + height, z)
+        glTexCoord2f(0, 0); glVertex3f(x, y + height, z)
         glEnd()
         
         # Clean up
-        glDeleteTextures(1, [texture_id])
+        glBindTexture(GL_TEXTURE_2D, 0)
         glDisable(GL_TEXTURE_2D)
         glEnable(GL_LIGHTING)
     
-    def draw_cube(self, width, height, depth):
-        """Draw a simple cube"""
+    def upload_vertices(self, vertices):
+        """Upload interleaved position+normal vertices to a new VBO"""
+        vbo = glGenBuffers(1)
+        glBindBuffer(GL_ARRAY_BUFFER, vbo)
+        glBufferData(GL_ARRAY_BUFFER, vertices.nbytes, vertices, GL_STATIC_DRAW)
+        glBindBuffer(GL_ARRAY_BUFFER, 0)
+        return vbo
+    
+    def draw_vertices(self, vbo, ranges):
+        """Draw (mode, first, count) ranges of interleaved position+normal vertices from a VBO"""
+        glBindBuffer(GL_ARRAY_BUFFER, vbo)
+        glEnableClientState(GL_VERTEX_ARRAY)
+        glEnableClientState(GL_NORMAL_ARRAY)
+        glVertexPointer(3, GL_FLOAT, 24, None)
+        glNormalPointer(GL_FLOAT, 24, ctypes.c_void_p(12))
+        for mode, first, count in ranges:
+            glDrawArrays(mode, first, count)
+        glDisableClientState(GL_NORMAL_ARRAY)
+        glDisableClientState(GL_VERTEX_ARRAY)
+        glBindBuffer(GL_ARRAY_BUFFER, 0)
+    
+    def cube_vertices(self, width=1.0, height=1.0, depth=1.0):
+        """Build interleaved position+normal vertices for a cube's quads"""
         w, h, d = width/2, height/2, depth/2
-        vertices = [
+        corners = [
             [w, h, d], [-w, h, d], [-w, -h, d], [w, -h, d],
             [w, h, -d], [-w, h, -d], [-w, -h, -d], [w, -h, -d]
         ]
-        
-        glBegin(GL_QUADS)
-        # Front face
-        glNormal3f(0, 0, 1)
-        glVertex3fv(vertices[0])
-        glVertex3fv(vertices[1])
-        glVertex3fv(vertices[2])
-        glVertex3fv(vertices[3])
-        
-        # Back face
-        glNormal3f(0, 0, -1)
-        glVertex3fv(vertices[4])
-        glVertex3fv(vertices[7])
-        glVertex3fv(vertices[6])
-        glVertex3fv(vertices[5])
-        
-        # Top face
-        glNormal3f(0, 1, 0)
-        glVertex3fv(vertices[0])
-        glVertex3fv(vertices[4])
-        glVertex3fv(vertices[5])
-        glVertex3fv(vertices[1])
-        
-        # Bottom face
-        glNormal3f(0, -1, 0)
-        glVertex3fv(vertices[3])
-        glVertex3fv(vertices[2])
-        glVertex3fv(vertices[6])
-        glVertex3fv(vertices[7])
-        
-        # Right face
-        glNormal3f(1, 0, 0)
-        glVertex3fv(vertices[0])
-        glVertex3fv(vertices[3])
-        glVertex3fv(vertices[7])
-        glVertex3fv(vertices[4])
-        
-        # Left face
-        glNormal3f(-1, 0, 0)
-        glVertex3fv(vertices[1])
-        glVertex3fv(vertices[5])
-        glVertex3fv(vertices[6])
-        glVertex3fv(vertices[2])
-        glEnd()
-    
-    def draw_cylinder(self, base_radius, top_radius, height, slices):
-        """Draw a cylinder"""
-        glBegin(GL_QUAD_STRIP)
-        for i in range(slices + 1):
-            angle = 2.0 * math.pi * i / slices
-            x = math.cos(angle)
-            y = math.sin(angle)
-            
-            # Calculate normals
-            nx, ny = x, y
-            norm = math.sqrt(nx*nx + ny*ny)
-            if norm > 0:
-                nx, ny = nx/norm, ny/norm
-            
-            glNormal3f(nx, ny, 0)
-            glVertex3f(base_radius * x, base_radius * y, 0)
-            glVertex3f(top_radius * x, top_radius * y, height)
-        glEnd()
-        
-        # Draw top and bottom circles
-        self.draw_circle(0, 0, 0, base_radius, slices, False)
-        self.draw_circle(0, 0, height, top_radius, slices, True)
-    
-    def draw_circle(self, x, y, z, radius, slices, facing_up=True):
-        """Draw a circle at given position"""
-        glBegin(GL_TRIANGLE_FAN)
-        if facing_up:
-            glNormal3f(0, 0, 1)
-        else:
-            glNormal3f(0, 0, -1)
-            
-        glVertex3f(x, y, z)  # Center
-        for i in range(slices + 1):
-            angle = 2.0 * math.pi * i / slices
-            cx = x + radius * math.cos(angle)
-            cy = y + radius * math.sin(angle)
-            glVertex3f(cx, cy, z)
-        glEnd()
+        faces = [
+            ((0, 0, 1), (0, 1, 2, 3)),   # Front face
+            ((0, 0, -1), (4, 7, 6, 5)),  # Back face
+            ((0, 1, 0), (0, 4, 5, 1)),   # Top face
+            ((0, -1, 0), (3, 2, 6, 7)),  # Bottom face
+            ((1, 0, 0), (0, 3, 7, 4)),   # Right face
+            ((-1, 0, 0), (1, 5, 6, 2)),  # Left face
+        ]
+        return np.array([corners[i] + list(normal) for normal, quad in faces for i in quad],
+                        dtype=np.float32)
     
-    def draw_horn(self):
-        """Draw a servo horn (cross shape)"""
-        # Main arm of the horn
+    def draw_cube(self, vbo, width, height, depth):
+        """Draw a simple cube from a unit cube VBO"""
         glPushMatrix()
-        glScalef(0.8, 0.2, 0.1)
-        self.draw_cube(1.0, 1.0, 1.0)
+        glScalef(width, height, depth)
+        self.draw_vertices(vbo, [(GL_QUADS, 0, 24)])
         glPopMatrix()
+    
+    def trig_table(self, slices):
+        """Return float32 cos/sin values for a circle split into slices"""
+        a = np.linspace(0, 2 * math.pi, slices + 1, dtype=np.float32)
+        return np.cos(a), np.sin(a)
+    
+    def cylinder_vertices(self, base_radius, top_radius, height, slices):
+        """Build interleaved position+normal vertices for a cylinder (layout in cylinder_ranges)"""
+        cos, sin = self.trig_table(slices)
+        zero = np.zeros_like(cos)
+        one = np.ones_like(cos)
+        # (cos, sin) is already unit length, so it doubles as the normal
+        bottom = np.column_stack([base_radius * cos, base_radius * sin, zero, cos, sin, zero])
+        top = np.column_stack([top_radius * cos, top_radius * sin, zero + height, cos, sin, zero])
+        # Alternate bottom and top rows for GL_QUAD_STRIP
+        side = np.stack([bottom, top], axis=1).reshape(-1, 6)
         
-        # Cross arm of the horn
-        glPushMatrix()
-        glScalef(0.2, 0.8, 0.1)
-        self.draw_cube(1.0, 1.0, 1.0)
-        glPopMatrix()
+        # Cap fans: center vertex followed by the rim, facing down and up
+        bottom_cap = np.column_stack([base_radius * cos, base_radius * sin, zero, zero, zero, -one])
+        top_cap = np.column_stack([top_radius * cos, top_radius * sin, zero + height, zero, zero, one])
+        return np.concatenate([
+            side,
+            [[0, 0, 0, 0, 0, -1]], bottom_cap,
+            [[0, 0, height, 0, 0, 1]], top_cap,
+        ]).astype(np.float32)
+    
+    def cylinder_ranges(self, slices):
+        """Return the (mode, first, count) draw ranges of a cylinder VBO"""
+        side_count = 2 * (slices + 1)
+        cap_count = slices + 2
+        return [
+            (GL_QUAD_STRIP, 0, side_count),
+            (GL_TRIANGLE_FAN, side_count, cap_count),
+            (GL_TRIANGLE_FAN, side_count + cap_count, cap_count),
+        ]
+    
+    def draw_cylinder(self, vbo, slices):
+        """Draw a cylinder from a VBO built by cylinder_vertices"""
+        # Side wall and both caps share the bound buffer and pointers
+        self.draw_vertices(vbo, self.cylinder_ranges(slices))
+    
+    def draw_horn(self, vbo):
+        """Draw a servo horn (cross shape) from its merged VBO"""
+        self.draw_vertices(vbo, [(GL_QUADS, 0, 48)])
     
     def handle_events(self):
         """Handle PyGame events"""
-        for event in pygame.event.get():
+        pygame.event.pump()
+        for event in pygame.event.get(HANDLED_EVENTS, pump=False):
             if event.type == pygame.QUIT:
                 self.running = False
                 return False
@@ -398,13 +554,22 @@ class ServoDigitalTwin:
                 elif event.key == pygame.K_ESCAPE:
                     self.running = False
                     return False
+            
+            # Window needs repainting (e.g. uncovered or restored)
+            elif event.type == pygame.VIDEOEXPOSE:
+                self.dirty = True
         return True
     
     def smooth_angle_update(self):
         """Smoothly update the angle towards the target for visual effect"""
+        now = time.perf_counter()
+        dt = now - self._last_update
+        self._last_update = now
+        
         if abs(self.angle - self.target_angle) > 0.5:
+            self.dirty = True
             direction = 1 if self.target_angle > self.angle else -1
-            self.angle += direction * 1.5  # Speed of animation
+            self.angle += direction * SPEED_DEG_PER_SEC * dt  # Independent of frame rate
             
             # Ensure we don't overshoot
             if direction > 0 and self.angle > self.target_angle:
@@ -421,9 +586,14 @@ class ServoDigitalTwin:
                 if not self.handle_events():
                     break
                     
+                self.flush_serial()
                 self.smooth_angle_update()
-                self.draw_servo()
-                clock.tick(60)  # 60 FPS
+                if self.dirty:
+                    self.dirty = False
+                    self.draw_servo()
+                else:
+                    pygame.time.wait(10)  # Nothing changed, skip the redraw
+                clock.tick(self.max_fps)  # Vsync in display.flip() normally paces frames first
                 
         except KeyboardInterrupt:
             print("Received keyboard interrupt, shutting down...")
@@ -433,6 +603,11 @@ class ServoDigitalTwin:
     def cleanup(self):
         """Clean up resources"""
         self.running = False
+        try:
+            glDeleteLists(self.body_list, 2)
+            glDeleteTextures(len(self._text_textures), list(self._text_textures.values()))
+        except Exception:
+            pass
         if self.serial_connected and self.arduino and self.arduino.is_open:
             try:
                 self.arduino.close()
@@ -509,7 +684,7 @@ def main():
     import argparse
     parser = argparse.ArgumentParser(description='Servo Motor Digital Twin')
     parser.add_argument('--port', help='Arduino serial port (e.g., COM3, /dev/ttyUSB0)')
-    parser.add_argument('--baud', type=int, default=9600, help='Baud rate (default: 9600)')
+    parser.add_argument('--baud', type=int, default=115200, help='Baud rate (default: 115200)')
     parser.add_argument('--list-ports', action='store_true', help='List available serial ports and exit')
     parser.add_argument('--sim', action='store_true', help='Run in simulation mode (no Arduino)')
     args = parser.parse_args()
@@ -1,9 +1,18 @@
 #!/usr/bin/env python3
 import serial
 import time
+import struct
 import os
 import sys
 
+# Serial frame headers; frames are two bytes, header then angle (0-180)
+ANGLE_HEADER = 0xFF  # Set angle (to Arduino) / angle report (from Arduino)
+ACK_HEADER = 0xFE    # Command acknowledgment from Arduino
+FRAME = struct.Struct('BB')  # (header, angle)
+
+# Partial frame left over from the last read_frames call
+frame_buffer = bytearray()
+
 def detect_arduino_port():
     """Auto-detect Arduino port"""
     try:
@@ -62,37 +71,41 @@ def list_ports():
         print(f"Error listing ports: {e}")
         return False
 
-def connect_to_arduino(port, baud_rate=9600):
+def connect_to_arduino(port, baud_rate=115200):
     """Connect to Arduino with error handling"""
     try:
         arduino = serial.Serial(
             port=port,
             baudrate=baud_rate,
-            timeout=1,
+            timeout=0.01,
             write_timeout=1,
             bytesize=serial.EIGHTBITS,
             parity=serial.PARITY_NONE,
             stopbits=serial.STOPBITS_ONE
         )
         
+        # Ask the USB-serial driver to deliver bytes immediately (not supported everywhere)
+        try:
+            arduino.set_low_latency_mode(True)
+        except (AttributeError, OSError, ValueError):
+            pass
+        
         # Wait for connection to establish
         time.sleep(2)
         
         # Clear any startup messages
         arduino.reset_input_buffer()
+        frame_buffer.clear()
         
         # Test communication
-        arduino.write(b"S:90\n")
+        arduino.write(FRAME.pack(ANGLE_HEADER, 90))
         time.sleep(0.5)
         
-        response = ""
         start_time = time.time()
         while time.time() - start_time < 1:  # Try reading for up to 1 second
-            if arduino.in_waiting > 0:
-                response += arduino.readline().decode('utf-8', errors='replace').strip()
-                if response.startswith("ACK:") or response.startswith("A:"):
-                    print("Communication verified with Arduino.")
-                    break
+            if arduino.in_waiting > 0 and read_frames(arduino):
+                print("Communication verified with Arduino.")
+                break
         
         print(f"Connected to Arduino on {port}")
         return arduino
@@ -100,19 +113,33 @@ def connect_to_arduino(port, baud_rate=9600):
         print(f"Failed to connect to Arduino: {e}")
         return None
 
+def read_frames(arduino):
+    """Read all pending (header, angle) frames from Arduino"""
+    frame_buffer.extend(arduino.read(arduino.in_waiting))
+    frames = []
+    i = 0
+    while i + 1 < len(frame_buffer):
+        # A header followed by another header lost its angle byte, so resync on the second one
+        if frame_buffer[i] in (ANGLE_HEADER, ACK_HEADER) and frame_buffer[i + 1] <= 180:
+            frames.append(FRAME.unpack_from(frame_buffer, i))
+            i += FRAME.size
+        else:
+            i += 1  # Skip bytes until we are aligned on a header
+    # Keep a trailing partial frame for the next read
+    del frame_buffer[:i]
+    return frames
+
 def send_command(arduino, angle):
     """Send command to Arduino using the proper protocol"""
     if arduino and arduino.is_open:
         try:
-            # Format command according to the Arduino code protocol: S:angle\n
-            command = f"S:{angle}\n"
-            arduino.write(command.encode())
+            # Frame according to the Arduino code protocol: ANGLE_HEADER, angle
+            arduino.write(FRAME.pack(ANGLE_HEADER, angle))
             
             # Wait for acknowledgment
             time.sleep(0.1)
             if arduino.in_waiting > 0:
-                response = arduino.readline().decode('utf-8', errors='replace').strip()
-                if response.startswith("ACK:"):
+                if any(header == ACK_HEADER for header, _ in read_frames(arduino)):
                     return True
             
             return True  # Even if no ACK, assume command was sent
@@ -124,13 +151,10 @@ def read_status(arduino):
     """Read status updates from Arduino"""
     if arduino and arduino.is_open and arduino.in_waiting > 0:
         try:
-            line = arduino.readline().decode('utf-8', errors='replace').strip()
-            if line.startswith("A:"):
-                try:
-                    angle = int(line[2:])
-                    return angle
-                except ValueError:
-                    pass
+            angles = [angle for header, angle in read_frames(arduino)
+                      if header == ANGLE_HEADER and angle <= 180]
+            if angles:
+                return angles[-1]  # Most recent report
         except Exception as e:
             print(f"Error reading status: {e}")
     return None
@@ -156,7 +180,7 @@ def main():
     import argparse
     parser = argparse.ArgumentParser(description='Servo Motor Controller')
     parser.add_argument('--port', help='Arduino serial port (e.g., COM3, /dev/ttyUSB0)')
-    parser.add_argument('--baud', type=int, default=9600, help='Baud rate (default: 9600)')
+    parser.add_argument('--baud', type=int, default=115200, help='Baud rate (default: 115200)')
     parser.add_argument('--list-ports', action='store_true', help='List available serial ports and exit')
     args = parser.parse_args()
     
@@ -0,0 +1,95 @@
+import sys
+import threading
+
+import pytest
+
+pytest.importorskip("serial")
+import rotate_servo
+
+
+class FakeSerial:
+    """Minimal stand-in for serial.Serial holding received bytes"""
+    def __init__(self, data):
+        self.data = data
+
+    @property
+    def in_waiting(self):
+        return len(self.data)
+
+    def read(self, size):
+        chunk, self.data = self.data[:size], self.data[size:]
+        return chunk
+
+
+@pytest.fixture(autouse=True)
+def clear_frame_buffer():
+    rotate_servo.frame_buffer.clear()
+
+
+def test_read_frames_skips_noise():
+    assert rotate_servo.read_frames(FakeSerial(b'x\xfe\x5a\xff\x5b')) == [(0xFE, 90), (0xFF, 91)]
+
+
+def test_read_frames_resyncs_after_lost_angle_byte():
+    assert rotate_servo.read_frames(FakeSerial(b'\xfe\x10\xff\xff\x50')) == [(0xFE, 16), (0xFF, 80)]
+
+
+def test_read_frames_keeps_partial_frame():
+    assert rotate_servo.read_frames(FakeSerial(b'\xfe\x5a\xff')) == [(0xFE, 90)]
+    assert rotate_servo.read_frames(FakeSerial(b'\x5b')) == [(0xFF, 91)]
+
+
+@pytest.fixture
+def twin(monkeypatch):
+    pytest.importorskip("pygame")
+    pytest.importorskip("OpenGL")
+    pytest.importorskip("numpy")
+    # GLUT is optional; keep glutInit() from needing a display
+    monkeypatch.setitem(sys.modules, "OpenGL.GLUT", None)
+    monkeypatch.delitem(sys.modules, "digital_twin", raising=False)
+    import digital_twin
+
+    # Skip __init__, which opens a window
+    twin = digital_twin.ServoDigitalTwin.__new__(digital_twin.ServoDigitalTwin)
+    twin.lock = threading.Lock()
+    twin._serial_buffer = bytearray()
+    twin.angle = twin.target_angle = 42
+    twin.dirty = False
+    twin.serial_connected = True
+    twin._pending_angle = None
+    twin._last_sent = None
+    twin._last_send_time = 0.0
+    return twin
+
+
+def test_handle_serial_data_keeps_partial_frame(twin):
+    twin.handle_serial_data(b'\x05\xff')
+    assert twin.angle == 42
+    twin.handle_serial_data(b'\x2d')
+    assert twin.angle == 45
+    assert twin.dirty
+    assert twin._serial_buffer == b''
+
+
+def test_handle_serial_data_ignores_acks(twin):
+    twin.handle_serial_data(b'\xfe\x10')
+    assert twin.angle == 42
+
+
+def test_handle_serial_data_resyncs_after_lost_angle_byte(twin):
+    twin.handle_serial_data(b'\xfe\x10\xff\xff\x50')
+    assert twin.angle == 80
+    assert twin._serial_buffer == b''
+
+
+def test_report_resets_duplicate_check(twin):
+    sent = []
+    twin.send_to_arduino = sent.append
+    twin.update_angle(100)
+    twin.flush_serial()
+    # Servo moved elsewhere (e.g. by the potentiometer), then the user steps back to 100
+    twin.handle_serial_data(b'\xff\x50')
+    twin._last_send_time = 0.0
+    twin.update_angle(100)
+    twin.flush_serial()
+    assert sent == [100, 100]